@@ -0,0 +1,53 @@
+"""Write precompressed .br and .gz siblings for the static CSS and JS files.
+
+Run this as part of a deploy, after the assets change:
+
+    python build_static.py
+
+main.py serves these siblings directly to clients that accept them, so
+static assets are never compressed per request.
+"""
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_FOLDERS = ["static/css", "static/js"]
+STATIC_EXTENSIONS = {".css", ".js"}
+
+
+def write_sibling(path: str, suffix: str, compress) -> int:
+    """Write a compressed sibling if it is missing or stale and return its size."""
+    sibling = f"{path}{suffix}"
+    source_mtime = os.stat(path).st_mtime
+    if os.path.exists(sibling) and os.stat(sibling).st_mtime >= source_mtime:
+        return os.path.getsize(sibling)
+
+    with open(path, "rb") as source:
+        data = compress(source.read())
+    with open(sibling, "wb") as target:
+        target.write(data)
+    return len(data)
+
+
+def build_static():
+    if brotli is None:
+        print("brotli is not installed, only writing .gz files")
+
+    for folder in STATIC_FOLDERS:
+        for entry in sorted(os.scandir(folder), key=lambda e: e.name):
+            if not entry.is_file() or os.path.splitext(entry.name)[1] not in STATIC_EXTENSIONS:
+                continue
+
+            original_size = entry.stat().st_size
+            sizes = [f"gz {write_sibling(entry.path, '.gz', lambda d: gzip.compress(d, 9, mtime=0))}"]
+            if brotli is not None:
+                sizes.append(f"br {write_sibling(entry.path, '.br', lambda d: brotli.compress(d, quality=11))}")
+            print(f"{entry.path}: {original_size} bytes -> {', '.join(sizes)}")
+
+
+if __name__ == "__main__":
+    build_static()
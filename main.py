@@ -1,8 +1,12 @@
 import os
+import time
+import asyncio
+import logging
+import zlib
 from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
-from fastapi import FastAPI, Request, Form, HTTPException, status, Depends, UploadFile, File, Query
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi import FastAPI, Request, Form, HTTPException, status, Depends, UploadFile, File, Query, Header
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
@@ -11,7 +15,7 @@ from sqlalchemy.orm import sessionmaker, declarative_base, Session
 import shutil
 import uuid
 import secrets
-from datetime import datetime
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -19,11 +23,25 @@ from starlette.responses import RedirectResponse
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
 import json
 from pathlib import Path
 from filetype import guess  # Replacement for imghdr
 
+# Optional compressors; gzip is always available through zlib
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -32,6 +50,275 @@ ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "default_password")
 SQLALCHEMY_DATABASE_URL = os.getenv("SQLALCHEMY_DATABASE_URL", "sqlite:///./default.db")
 SECRET_KEY = os.getenv("SECRET_KEY", secrets.token_hex(32))
 
+# Deferred file deletion settings
+TOMBSTONE_BATCH_SIZE = int(os.getenv("TOMBSTONE_BATCH_SIZE", "100"))
+TOMBSTONE_COLLECT_INTERVAL = float(os.getenv("TOMBSTONE_COLLECT_INTERVAL", "60"))
+TOMBSTONE_MAX_ATTEMPTS = int(os.getenv("TOMBSTONE_MAX_ATTEMPTS", "5"))
+ORPHAN_GRACE_SECONDS = int(os.getenv("ORPHAN_GRACE_SECONDS", "3600"))
+
+logger = logging.getLogger(__name__)
+
+# Upload folders that hold files referenced from the database
+UPLOAD_FOLDERS = ["uploads/sketch_sales", "uploads/image_sketches"]
+
+# Catalog change feed settings
+CATALOG_EVENT_POLL_INTERVAL = float(os.getenv("CATALOG_EVENT_POLL_INTERVAL", "1"))
+CATALOG_EVENT_RETENTION_HOURS = int(os.getenv("CATALOG_EVENT_RETENTION_HOURS", "24"))
+CATALOG_EVENT_REPLAY_LIMIT = int(os.getenv("CATALOG_EVENT_REPLAY_LIMIT", "500"))
+SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", "100"))
+SSE_HEARTBEAT_INTERVAL = float(os.getenv("SSE_HEARTBEAT_INTERVAL", "15"))
+
+# Response compression settings
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1000"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_LEVEL = int(os.getenv("BROTLI_LEVEL", "5"))
+ZSTD_LEVEL = int(os.getenv("ZSTD_LEVEL", "3"))
+
+# Content types worth compressing on the fly
+COMPRESSIBLE_TYPES = {
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/javascript",
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+}
+
+# Path prefixes that only hold already-compressed files (JPEG, PNG, WebP, ...)
+COMPRESSION_SKIP_PREFIXES = ("/uploads",)
+
+# Precompressed siblings written by build_static.py, in preference order
+PRECOMPRESSED_SUFFIXES = [("br", ".br"), ("gzip", ".gz")]
+
+# Response compression
+def available_encodings() -> List[str]:
+    """Return the encodings this process can produce, in preference order."""
+    encodings = []
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    encodings.append("gzip")
+    return encodings
+
+def parse_accept_encoding(header: str) -> dict:
+    """Parse an Accept-Encoding header into a {coding: q} dict."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+def negotiate_encoding(header: str, encodings: List[str]) -> Optional[str]:
+    """Pick the best encoding the client accepts, preferring ours on ties."""
+    accepted = parse_accept_encoding(header)
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.split(";")[0].strip().lower() in COMPRESSIBLE_TYPES
+
+def add_vary_accept_encoding(headers: MutableHeaders):
+    vary = headers.get("vary", "")
+    if "accept-encoding" not in vary.lower():
+        headers.add_vary_header("Accept-Encoding")
+
+class StreamCompressor:
+    """Incremental compressor with the same interface for every encoding."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_LEVEL)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+# Per-route compression counters, exposed at /admin/compression/stats.
+# Each worker process keeps its own counters.
+compression_stats = {}
+
+# Label for requests that match no route, so unknown URLs cannot add keys
+UNMATCHED_ROUTE_LABEL = "<unmatched>"
+
+def record_compression(route: str, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float):
+    stats = compression_stats.setdefault(route, {
+        "responses": 0,
+        "bytes_in": 0,
+        "bytes_out": 0,
+        "cpu_seconds": 0.0,
+        "encodings": {},
+    })
+    stats["responses"] += 1
+    stats["bytes_in"] += bytes_in
+    stats["bytes_out"] += bytes_out
+    stats["cpu_seconds"] += cpu_seconds
+    stats["encodings"][encoding] = stats["encodings"].get(encoding, 0) + 1
+
+def route_label(scope) -> str:
+    """Label a request by its route template, or by the mount prefix for static files."""
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    if scope["path"].startswith("/static/"):
+        return "/static"
+    return UNMATCHED_ROUTE_LABEL
+
+class CompressionMiddleware:
+    """Compress text responses with br, zstd or gzip depending on the client.
+
+    Responses that already carry a Content-Encoding (such as precompressed
+    static files), non-text content types and paths under
+    COMPRESSION_SKIP_PREFIXES are passed through untouched.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(COMPRESSION_SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        start_message = None
+        compressor = None
+        bytes_in = bytes_out = 0
+        cpu_seconds = 0.0
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, bytes_in, bytes_out, cpu_seconds
+
+            if message["type"] == "http.response.start":
+                # Hold the headers back until the first body chunk shows whether to compress
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                compressible = is_compressible(headers.get("content-type", ""))
+                if compressible:
+                    add_vary_accept_encoding(headers)
+                if (
+                    not compressible
+                    or encoding is None
+                    or "content-encoding" in headers
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    await send(start_message)
+                    start_message = None
+                    await send(message)
+                    return
+
+                compressor = StreamCompressor(encoding)
+                headers["Content-Encoding"] = encoding
+                del headers["Content-Length"]
+                # A compressed body must not share a strong validator with the identity one
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                pending_start = start_message
+                start_message = None
+            elif compressor is None:
+                await send(message)
+                return
+            else:
+                pending_start = None
+
+            started = time.thread_time()
+            chunk = compressor.compress(body)
+            if not more_body:
+                chunk += compressor.finish()
+            cpu_seconds += time.thread_time() - started
+            bytes_in += len(body)
+            bytes_out += len(chunk)
+
+            if pending_start is not None:
+                if not more_body:
+                    MutableHeaders(raw=pending_start["headers"])["Content-Length"] = str(len(chunk))
+                await send(pending_start)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+            if not more_body:
+                record_compression(route_label(scope), encoding, bytes_in, bytes_out, cpu_seconds)
+
+        await self.app(scope, receive, send_wrapper)
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Serve the .br/.gz siblings written by build_static.py when the client accepts them.
+
+    A sibling older than its source file is ignored, so an un-rebuilt edit
+    never serves stale content. The sibling is picked by the client's
+    Accept-Encoding preferences.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        request_headers = Headers(scope=scope)
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        if not is_compressible(response.media_type):
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        siblings = {}
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+            try:
+                sibling_stat = os.stat(f"{full_path}{suffix}")
+            except OSError:
+                continue
+            if sibling_stat.st_mtime >= stat_result.st_mtime:
+                siblings[encoding] = (f"{full_path}{suffix}", sibling_stat)
+
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""), list(siblings))
+        if encoding is not None:
+            sibling_path, sibling_stat = siblings[encoding]
+            response = FileResponse(
+                sibling_path,
+                status_code=status_code,
+                stat_result=sibling_stat,
+                media_type=response.media_type,
+                headers={"Content-Encoding": encoding},
+            )
+
+        # Set before the 304 check so Not Modified responses carry it too
+        add_vary_accept_encoding(response.headers)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
 # Ensure required folders exist
 def ensure_folders():
     required_folders = [
@@ -52,7 +339,7 @@ ensure_folders()
 # Initialize FastAPI with middleware
 middleware = [
     Middleware(SessionMiddleware, secret_key=SECRET_KEY),
-    Middleware(GZipMiddleware, minimum_size=1000)
+    Middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
 ]
 
 app = FastAPI(middleware=middleware)
@@ -67,7 +354,7 @@ app.add_middleware(
 )
 
 # Mount static and upload folders
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", PrecompressedStaticFiles(directory="static"), name="static")
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
 # Set up Jinja2 templates
@@ -110,6 +397,22 @@ class ImageSketchCreate(BaseModel):
 class ImageSketchUpdate(BaseModel):
     description: str = Field(..., min_length=3, max_length=500)
 
+# Formatters for API fields
+def format_price(value):
+    return f"${value:.2f}"
+
+def format_datetime(value):
+    return value.isoformat() if value else None
+
+def serialize_fields(obj, api_fields: dict, fields: Optional[List[str]] = None) -> dict:
+    """Build an API dict from a model instance or a projected row."""
+    data = {}
+    for field in fields or api_fields:
+        attr, formatter = api_fields[field]
+        value = getattr(obj, attr)
+        data[field] = formatter(value) if formatter else value
+    return data
+
 # Database models
 class SketchSale(Base):
     __tablename__ = "sketch_sales"
@@ -121,16 +424,19 @@ class SketchSale(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "imageUrl": self.sketch_image,
-            "name": self.description,
-            "price": f"${self.price:.2f}",
-            "is_sold": self.is_sold,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
+    # API field name -> (column attribute, formatter)
+    api_fields = {
+        "id": ("id", None),
+        "imageUrl": ("sketch_image", None),
+        "name": ("description", None),
+        "price": ("price", format_price),
+        "is_sold": ("is_sold", None),
+        "created_at": ("created_at", format_datetime),
+        "updated_at": ("updated_at", format_datetime),
+    }
+
+    def to_dict(self, fields: Optional[List[str]] = None):
+        return serialize_fields(self, self.api_fields, fields)
 
 class ImageSketch(Base):
     __tablename__ = "image_sketches"
@@ -141,15 +447,48 @@ class ImageSketch(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "photo_image": self.photo_image,
-            "sketch_image": self.sketch_image,
-            "description": self.description,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
+    # API field name -> (column attribute, formatter)
+    api_fields = {
+        "id": ("id", None),
+        "photo_image": ("photo_image", None),
+        "sketch_image": ("sketch_image", None),
+        "description": ("description", None),
+        "created_at": ("created_at", format_datetime),
+        "updated_at": ("updated_at", format_datetime),
+    }
+
+    def to_dict(self, fields: Optional[List[str]] = None):
+        return serialize_fields(self, self.api_fields, fields)
+
+class FileTombstone(Base):
+    """An uploaded file waiting to be removed from disk by the collector."""
+    __tablename__ = "file_tombstones"
+    id = Column(Integer, primary_key=True, index=True)
+    file_path = Column(String, nullable=False, index=True)
+    attempts = Column(Integer, default=0)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class CatalogEvent(Base):
+    """A committed catalog change, relayed to every worker's SSE subscribers."""
+    __tablename__ = "catalog_events"
+    # Never reuse ids after pruning; relays and Last-Event-ID rely on them only growing
+    __table_args__ = {"sqlite_autoincrement": True}
+    id = Column(Integer, primary_key=True, index=True)
+    table_name = Column(String, nullable=False)
+    record_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)
+    updated_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    def to_sse(self) -> str:
+        data = json.dumps({
+            "id": self.record_id,
+            "table": self.table_name,
+            "op": self.op,
+            "updated_at": format_datetime(self.updated_at),
+        })
+        return f"id: {self.id}\nevent: change\ndata: {data}\n\n"
 
 # Create the database tables
 Base.metadata.create_all(bind=engine)
@@ -194,6 +533,312 @@ def save_upload_file(upload_file: UploadFile, folder: str) -> str:
     
     return filename
 
+# Helper functions for sparse fieldsets and batch lookups
+MAX_BATCH_IDS = 100
+
+def parse_fields(model, fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma separated fields= parameter, or return None for all fields."""
+    if not fields:
+        return None
+    selected = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in selected if f not in model.api_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(model.api_fields)}"
+        )
+    return selected or None
+
+def parse_ids(ids: str) -> List[int]:
+    """Parse a comma separated ids= parameter into a de-duplicated list."""
+    try:
+        parsed = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be comma separated integers")
+    if not parsed:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At least one id is required")
+    if len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_IDS} ids can be requested at once"
+        )
+    return parsed
+
+def query_fields(db: Session, model, fields: Optional[List[str]]):
+    """Query a model, selecting only the columns behind the requested fields."""
+    if not fields:
+        return db.query(model)
+    columns = [getattr(model, model.api_fields[field][0]) for field in fields]
+    return db.query(*columns)
+
+def fetch_batch(db: Session, model, ids: List[int], fields: Optional[List[str]]) -> dict:
+    """Fetch many records by primary key in one query, keeping the requested order."""
+    # The id column is always selected so rows can be matched back to the request
+    query_columns = fields if not fields or "id" in fields else ["id"] + fields
+    rows = query_fields(db, model, query_columns).filter(model.id.in_(ids)).all()
+    by_id = {row.id: serialize_fields(row, model.api_fields, fields) for row in rows}
+    return {
+        "items": [by_id[i] for i in ids if i in by_id],
+        "missing": [i for i in ids if i not in by_id],
+    }
+
+# Helper functions for deferred file deletion
+def schedule_file_deletion(db: Session, image_url: Optional[str]):
+    """Record an uploaded file for deletion as part of the current transaction.
+
+    The file stays on disk until the collector runs, so a failed commit
+    never leaves a row pointing at a missing file.
+    """
+    if image_url:
+        db.add(FileTombstone(file_path=image_url.lstrip('/')))
+
+def collect_tombstones(batch_size: int = TOMBSTONE_BATCH_SIZE) -> int:
+    """Remove tombstoned files from disk in batches and return how many were cleared.
+
+    Tombstones that failed TOMBSTONE_MAX_ATTEMPTS times are no longer retried;
+    they stay in the table and are reported by /admin/uploads/reconcile.
+    """
+    db = SessionLocal()
+    cleared = 0
+    last_id = 0
+    try:
+        while True:
+            batch = (
+                db.query(FileTombstone)
+                .filter(FileTombstone.id > last_id)
+                .filter(FileTombstone.attempts < TOMBSTONE_MAX_ATTEMPTS)
+                .order_by(FileTombstone.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            done_ids = []
+            for tombstone in batch:
+                try:
+                    os.remove(tombstone.file_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    # Keep the tombstone so the next run retries it
+                    tombstone.attempts = (tombstone.attempts or 0) + 1
+                    tombstone.last_error = str(e)
+                    if tombstone.attempts >= TOMBSTONE_MAX_ATTEMPTS:
+                        logger.warning(
+                            "Giving up on deleting %s after %d attempts: %s",
+                            tombstone.file_path, tombstone.attempts, e
+                        )
+                    continue
+                done_ids.append(tombstone.id)
+
+            if done_ids:
+                db.query(FileTombstone).filter(FileTombstone.id.in_(done_ids)).delete(
+                    synchronize_session=False
+                )
+            db.commit()
+            cleared += len(done_ids)
+    finally:
+        db.close()
+    return cleared
+
+def wake_tombstone_collector():
+    """Ask the background collector to run now instead of waiting for its interval."""
+    wakeup = getattr(app.state, "tombstone_wakeup", None)
+    if wakeup is not None:
+        wakeup.set()
+
+async def tombstone_collector_loop(wakeup: asyncio.Event):
+    while True:
+        try:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=TOMBSTONE_COLLECT_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            await run_in_threadpool(collect_tombstones)
+        except Exception:
+            logger.exception("File tombstone collection failed")
+
+def reconcile_uploads(db: Session, clean: bool = False, limit: int = 100) -> dict:
+    """Compare the upload folders against the database and report orphaned files.
+
+    Only paths are loaded from the database and directories are walked with
+    os.scandir, so files are stat'ed only when they look orphaned. Files newer
+    than ORPHAN_GRACE_SECONDS are skipped since they may belong to an upload
+    whose transaction has not committed yet. With clean=True the orphans are
+    tombstoned and left to the collector.
+    """
+    referenced = set()
+    for (sketch_image,) in db.query(SketchSale.sketch_image):
+        if sketch_image:
+            referenced.add(sketch_image.lstrip('/'))
+    for photo_image, sketch_image in db.query(ImageSketch.photo_image, ImageSketch.sketch_image):
+        for image_path in (photo_image, sketch_image):
+            if image_path:
+                referenced.add(image_path.lstrip('/'))
+    pending = {file_path for (file_path,) in db.query(FileTombstone.file_path)}
+    failed = [
+        {"file_path": file_path, "attempts": attempts, "last_error": last_error}
+        for file_path, attempts, last_error in db.query(
+            FileTombstone.file_path, FileTombstone.attempts, FileTombstone.last_error
+        ).filter(FileTombstone.attempts >= TOMBSTONE_MAX_ATTEMPTS)
+    ]
+
+    cutoff = time.time() - ORPHAN_GRACE_SECONDS
+    scanned = 0
+    orphans = []
+    for folder in UPLOAD_FOLDERS:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                scanned += 1
+                file_path = f"{folder}/{entry.name}"
+                if file_path in referenced or file_path in pending:
+                    continue
+                if entry.stat(follow_symlinks=False).st_mtime > cutoff:
+                    continue
+                orphans.append(file_path)
+
+    if clean and orphans:
+        db.add_all(FileTombstone(file_path=file_path) for file_path in orphans)
+        db.commit()
+
+    return {
+        "scanned": scanned,
+        "referenced": len(referenced),
+        "pending_deletion": len(pending),
+        "failed_deletions": failed[:limit],
+        "orphan_count": len(orphans),
+        "orphans": orphans[:limit],
+        "cleaned": clean,
+    }
+
+# Helper functions for the catalog change feed
+def record_catalog_event(db: Session, record, op: str):
+    """Record a change to a catalog row as part of the current transaction.
+
+    Call after db.flush() for new rows so the primary key is known.
+    """
+    db.add(CatalogEvent(
+        table_name=record.__tablename__,
+        record_id=record.id,
+        op=op,
+        updated_at=datetime.utcnow() if op == "delete" else record.updated_at,
+    ))
+
+def fetch_catalog_events(after_id: int, limit: int = CATALOG_EVENT_REPLAY_LIMIT) -> List[tuple]:
+    """Return (event id, SSE frame) pairs for events newer than after_id."""
+    db = SessionLocal()
+    try:
+        events = (
+            db.query(CatalogEvent)
+            .filter(CatalogEvent.id > after_id)
+            .order_by(CatalogEvent.id)
+            .limit(limit)
+            .all()
+        )
+        return [(event.id, event.to_sse()) for event in events]
+    finally:
+        db.close()
+
+def latest_catalog_event_id() -> int:
+    db = SessionLocal()
+    try:
+        latest = db.query(CatalogEvent.id).order_by(CatalogEvent.id.desc()).first()
+        return latest[0] if latest else 0
+    finally:
+        db.close()
+
+def prune_catalog_events():
+    """Drop events older than CATALOG_EVENT_RETENTION_HOURS."""
+    db = SessionLocal()
+    try:
+        cutoff = datetime.utcnow() - timedelta(hours=CATALOG_EVENT_RETENTION_HOURS)
+        db.query(CatalogEvent).filter(CatalogEvent.created_at < cutoff).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+# Sent to a subscriber whose queue overflowed; the client should refetch from the REST API
+SSE_RESYNC = (None, "event: resync\ndata: {}\n\n")
+
+class CatalogEventHub:
+    """Fan catalog change events out to the SSE subscribers of this worker.
+
+    Each subscriber is a bounded queue of pre-encoded frames, so an idle
+    connection costs one queue and one suspended coroutine. A subscriber
+    that falls behind has its backlog replaced by a single resync event
+    instead of holding memory for it.
+    """
+
+    def __init__(self, queue_size: int = SSE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.subscribers = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    def publish(self, events: List[tuple]):
+        for queue in self.subscribers:
+            for event in events:
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(SSE_RESYNC)
+                    break
+
+catalog_hub = CatalogEventHub()
+
+def wake_catalog_relay():
+    """Ask the relay to publish this worker's commit now instead of at the next poll."""
+    wakeup = getattr(app.state, "catalog_event_wakeup", None)
+    if wakeup is not None:
+        wakeup.set()
+
+async def catalog_event_relay_loop(wakeup: asyncio.Event):
+    """Poll the catalog_events table and publish new rows to this worker's hub.
+
+    Every worker runs its own relay against the shared database, so a change
+    committed by any worker reaches all subscribers. Polling by id relies on
+    SQLite serialising writes so ids are committed in order; databases that
+    allocate ids before commit (Postgres, MySQL) can commit a lower id after
+    the relay has moved past it.
+    """
+    last_id = None
+    last_prune = time.monotonic()
+    while True:
+        try:
+            if last_id is None:
+                last_id = await run_in_threadpool(latest_catalog_event_id)
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=CATALOG_EVENT_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            events = await run_in_threadpool(fetch_catalog_events, last_id)
+            if events:
+                last_id = events[-1][0]
+                catalog_hub.publish(events)
+                if len(events) == CATALOG_EVENT_REPLAY_LIMIT:
+                    # More events are waiting, poll again right away
+                    wake_catalog_relay()
+            if time.monotonic() - last_prune > 3600:
+                await run_in_threadpool(prune_catalog_events)
+                last_prune = time.monotonic()
+        except Exception:
+            logger.exception("Catalog event relay failed")
+            await asyncio.sleep(CATALOG_EVENT_POLL_INTERVAL)
+
 # Authentication helper
 def verify_admin(request: Request):
     """Verify if user is admin from session cookie."""
@@ -269,17 +914,20 @@ async def products(
 async def api_products(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = Query(None),
     db: Session = Depends(get_db)
 ):
+    selected_fields = parse_fields(SketchSale, fields)
+    
     # Calculate pagination
     offset = (page - 1) * limit
     
-    # Query sketch sales with pagination
+    # Query sketch sales with pagination, selecting only the requested columns
     total = db.query(SketchSale).count()
-    sketch_sales = db.query(SketchSale).offset(offset).limit(limit).all()
+    sketch_sales = query_fields(db, SketchSale, selected_fields).offset(offset).limit(limit).all()
     
     # Convert to a list of dictionaries
-    products = [sale.to_dict() for sale in sketch_sales]
+    products = [serialize_fields(sale, SketchSale.api_fields, selected_fields) for sale in sketch_sales]
     
     return {
         "total": total,
@@ -289,6 +937,14 @@ async def api_products(
         "items": products
     }
 
+@app.get("/api/products/batch", response_class=JSONResponse)
+async def api_products_batch(
+    ids: str = Query(...),
+    fields: Optional[str] = Query(None),
+    db: Session = Depends(get_db)
+):
+    return fetch_batch(db, SketchSale, parse_ids(ids), parse_fields(SketchSale, fields))
+
 @app.get("/portfolio", response_class=HTMLResponse)
 async def portfolio(
     request: Request,
@@ -328,17 +984,20 @@ async def portfolio(
 async def api_portfolio(
     page: int = Query(1, ge=1),
     limit: int = Query(12, ge=1, le=100),
+    fields: Optional[str] = Query(None),
     db: Session = Depends(get_db)
 ):
+    selected_fields = parse_fields(ImageSketch, fields)
+    
     # Calculate pagination
     offset = (page - 1) * limit
     
-    # Query image sketches with pagination
+    # Query image sketches with pagination, selecting only the requested columns
     total = db.query(ImageSketch).count()
-    image_sketches = db.query(ImageSketch).offset(offset).limit(limit).all()
+    image_sketches = query_fields(db, ImageSketch, selected_fields).offset(offset).limit(limit).all()
     
     # Convert to a list of dictionaries
-    items = [sketch.to_dict() for sketch in image_sketches]
+    items = [serialize_fields(sketch, ImageSketch.api_fields, selected_fields) for sketch in image_sketches]
     
     return {
         "total": total,
@@ -348,6 +1007,54 @@ async def api_portfolio(
         "items": items
     }
 
+@app.get("/api/portfolio/batch", response_class=JSONResponse)
+async def api_portfolio_batch(
+    ids: str = Query(...),
+    fields: Optional[str] = Query(None),
+    db: Session = Depends(get_db)
+):
+    return fetch_batch(db, ImageSketch, parse_ids(ids), parse_fields(ImageSketch, fields))
+
+@app.get("/api/events")
+async def api_events(last_event_id: Optional[str] = Header(None)):
+    # Ignore anything int() can't parse, such as superscript digits
+    replay_from = int(last_event_id) if last_event_id and last_event_id.isdecimal() else None
+    
+    async def event_stream():
+        # Subscribe inside the stream so the finally below always unsubscribes,
+        # and before replaying so nothing committed in between is missed
+        queue = catalog_hub.subscribe()
+        last_sent = replay_from or 0
+        try:
+            yield "retry: 3000\n\n"
+            if replay_from is not None:
+                replay = await run_in_threadpool(
+                    fetch_catalog_events, replay_from, CATALOG_EVENT_REPLAY_LIMIT + 1
+                )
+                if len(replay) > CATALOG_EVENT_REPLAY_LIMIT:
+                    replay = [SSE_RESYNC]
+                for event_id, frame in replay:
+                    last_sent = event_id or last_sent
+                    yield frame
+            while True:
+                try:
+                    event_id, frame = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                # Skip events already sent during the replay
+                if event_id is not None and event_id <= last_sent:
+                    continue
+                yield frame
+        finally:
+            catalog_hub.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @app.get("/admin", response_class=HTMLResponse)
 async def read_admin(request: Request, db: Session = Depends(get_db)):
     # Check if the user is logged in
@@ -438,8 +1145,11 @@ async def create_sketch_sale(
     )
     
     db.add(new_sketch_sale)
+    db.flush()
+    record_catalog_event(db, new_sketch_sale, "create")
     db.commit()
     db.refresh(new_sketch_sale)
+    wake_catalog_relay()
     
     return RedirectResponse(url="/admin", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -460,14 +1170,14 @@ async def delete_sketch_sale(
     if not sketch_sale:
         raise HTTPException(status_code=404, detail="Sketch Sale not found")
     
-    # Delete the image file if it exists
-    if sketch_sale.sketch_image:
-        file_path = sketch_sale.sketch_image.lstrip('/')
-        if os.path.exists(file_path):
-            os.remove(file_path)
+    # Queue the image file for deletion once the row is gone
+    schedule_file_deletion(db, sketch_sale.sketch_image)
+    record_catalog_event(db, sketch_sale, "delete")
     
     db.delete(sketch_sale)
     db.commit()
+    wake_tombstone_collector()
+    wake_catalog_relay()
     
     return RedirectResponse(url="/admin", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -521,11 +1231,8 @@ async def update_sketch_sale(
                 detail="Invalid image file. Supported formats: JPG, PNG, GIF, WebP"
             )
         
-        # Delete old image if it exists
-        if sketch_sale.sketch_image:
-            old_file_path = sketch_sale.sketch_image.lstrip('/')
-            if os.path.exists(old_file_path):
-                os.remove(old_file_path)
+        # Queue old image for deletion
+        schedule_file_deletion(db, sketch_sale.sketch_image)
         
         # Save new image
         sketch_image_filename = save_upload_file(new_image, "uploads/sketch_sales")
@@ -536,9 +1243,12 @@ async def update_sketch_sale(
     sketch_sale.description = sketch_data.description
     sketch_sale.is_sold = sketch_data.is_sold
     sketch_sale.updated_at = datetime.utcnow()
+    record_catalog_event(db, sketch_sale, "update")
     
     db.commit()
     db.refresh(sketch_sale)
+    wake_tombstone_collector()
+    wake_catalog_relay()
     
     return RedirectResponse(url="/admin", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -579,8 +1289,11 @@ async def create_image_sketch(
     )
     
     db.add(new_image_sketch)
+    db.flush()
+    record_catalog_event(db, new_image_sketch, "create")
     db.commit()
     db.refresh(new_image_sketch)
+    wake_catalog_relay()
     
     return RedirectResponse(url="/admin", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -601,15 +1314,15 @@ async def delete_image_sketch(
     if not image_sketch:
         raise HTTPException(status_code=404, detail="Image Sketch not found")
     
-    # Delete image files if they exist
+    # Queue image files for deletion once the row is gone
     for image_path in [image_sketch.photo_image, image_sketch.sketch_image]:
-        if image_path:
-            file_path = image_path.lstrip('/')
-            if os.path.exists(file_path):
-                os.remove(file_path)
+        schedule_file_deletion(db, image_path)
+    record_catalog_event(db, image_sketch, "delete")
     
     db.delete(image_sketch)
     db.commit()
+    wake_tombstone_collector()
+    wake_catalog_relay()
     
     return RedirectResponse(url="/admin", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -662,11 +1375,8 @@ async def update_image_sketch(
                 detail="Invalid photo image file. Supported formats: JPG, PNG, GIF, WebP"
             )
         
-        # Delete old image if it exists
-        if image_sketch.photo_image:
-            old_file_path = image_sketch.photo_image.lstrip('/')
-            if os.path.exists(old_file_path):
-                os.remove(old_file_path)
+        # Queue old image for deletion
+        schedule_file_deletion(db, image_sketch.photo_image)
         
         # Save new image
         photo_image_filename = save_upload_file(new_photo, "uploads/image_sketches")
@@ -681,11 +1391,8 @@ async def update_image_sketch(
                 detail="Invalid sketch image file. Supported formats: JPG, PNG, GIF, WebP"
             )
         
-        # Delete old image if it exists
-        if image_sketch.sketch_image:
-            old_file_path = image_sketch.sketch_image.lstrip('/')
-            if os.path.exists(old_file_path):
-                os.remove(old_file_path)
+        # Queue old image for deletion
+        schedule_file_deletion(db, image_sketch.sketch_image)
         
         # Save new image
         sketch_image_filename = save_upload_file(new_sketch, "uploads/image_sketches")
@@ -694,12 +1401,40 @@ async def update_image_sketch(
     # Update description
     image_sketch.description = image_data.description
     image_sketch.updated_at = datetime.utcnow()
+    record_catalog_event(db, image_sketch, "update")
     
     db.commit()
     db.refresh(image_sketch)
+    wake_tombstone_collector()
+    wake_catalog_relay()
     
     return RedirectResponse(url="/admin", status_code=status.HTTP_303_SEE_OTHER)
 
+# Routes for upload maintenance
+@app.get("/admin/uploads/reconcile", response_class=JSONResponse)
+async def report_orphan_uploads(
+    request: Request,
+    limit: int = Query(100, ge=0, le=10000),
+    db: Session = Depends(get_db)
+):
+    # Verify admin
+    verify_admin(request)
+    
+    return await run_in_threadpool(reconcile_uploads, db, False, limit)
+
+@app.post("/admin/uploads/reconcile", response_class=JSONResponse)
+async def clean_orphan_uploads(
+    request: Request,
+    limit: int = Query(100, ge=0, le=10000),
+    db: Session = Depends(get_db)
+):
+    # Verify admin
+    verify_admin(request)
+    
+    report = await run_in_threadpool(reconcile_uploads, db, True, limit)
+    wake_tombstone_collector()
+    return report
+
 @app.exception_handler(StarletteHTTPException)
 async def custom_http_exception_handler(request: Request, exc: StarletteHTTPException):
     if exc.status_code == 404:
@@ -718,6 +1453,52 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         status_code=422
     )
 
+# Compression report
+@app.get("/admin/compression/stats", response_class=JSONResponse)
+async def compression_report(request: Request):
+    """Report compression counters for the worker that serves this request.
+
+    Counters live in process memory, so with several workers each one
+    only reports its own share of the traffic.
+    """
+    # Verify admin
+    verify_admin(request)
+    
+    routes = {}
+    for route, stats in compression_stats.items():
+        routes[route] = {
+            **stats,
+            "bytes_saved": stats["bytes_in"] - stats["bytes_out"],
+            "cpu_ms_per_response": round(stats["cpu_seconds"] * 1000 / stats["responses"], 3),
+        }
+    return {"encodings": available_encodings(), "routes": routes}
+
+# Background file tombstone collector
+@app.on_event("startup")
+async def start_tombstone_collector():
+    # Created on startup so the event belongs to the loop the app is running on
+    app.state.tombstone_wakeup = asyncio.Event()
+    app.state.tombstone_collector = asyncio.create_task(
+        tombstone_collector_loop(app.state.tombstone_wakeup)
+    )
+
+@app.on_event("shutdown")
+async def stop_tombstone_collector():
+    app.state.tombstone_collector.cancel()
+
+# Catalog change feed relay
+@app.on_event("startup")
+async def start_catalog_event_relay():
+    # Created on startup so the event belongs to the loop the app is running on
+    app.state.catalog_event_wakeup = asyncio.Event()
+    app.state.catalog_event_relay = asyncio.create_task(
+        catalog_event_relay_loop(app.state.catalog_event_wakeup)
+    )
+
+@app.on_event("shutdown")
+async def stop_catalog_event_relay():
+    app.state.catalog_event_relay.cancel()
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
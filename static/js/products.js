@@ -5,7 +5,12 @@ $(document).ready(function() {
         currentPage: 1,
         totalItems: 0,
         isLoading: false,
-        isInitialLoad: true
+        isInitialLoad: true,
+        fields: 'id,name,price,imageUrl,is_sold',
+        currentItems: [],
+        pendingChanges: [],
+        changeTimer: null,
+        reloadPending: false
     };
 
     // DOM Elements
@@ -35,6 +40,7 @@ $(document).ready(function() {
     // Event Handlers
     elements.prevBtn.click(handlePreviousPage);
     elements.nextBtn.click(handleNextPage);
+    subscribeToChanges();
 
     function init() {
         showLoading();
@@ -61,7 +67,7 @@ $(document).ready(function() {
         }
 
         $.ajax({
-            url: `/api/products?page=${config.currentPage}&limit=${config.itemsPerPage}`,
+            url: `/api/products?page=${config.currentPage}&limit=${config.itemsPerPage}&fields=${config.fields}`,
             method: 'GET',
             dataType: 'json',
             success: function(data) {
@@ -80,11 +86,19 @@ $(document).ready(function() {
                 config.isLoading = false;
                 config.isInitialLoad = false;
                 hideLoading();
+
+                // A change arrived while this page was loading, so fetch it again
+                if (config.reloadPending) {
+                    config.reloadPending = false;
+                    loadProducts();
+                }
             }
         });
     }
 
     function renderProducts(products) {
+        config.currentItems = products || [];
+
         // Clear both containers
         elements.availableProducts.empty();
         elements.soldProducts.empty();
@@ -183,6 +197,64 @@ $(document).ready(function() {
         }
     }
 
+    // Live catalog updates
+    function subscribeToChanges() {
+        if (!window.EventSource) return;
+
+        const source = new EventSource('/api/events');
+        source.addEventListener('change', function(e) {
+            const change = JSON.parse(e.data);
+            if (change.table === 'sketch_sales') {
+                queueChange(change);
+            }
+        });
+        // The server dropped events for this client, so refetch the page
+        source.addEventListener('resync', reloadCurrentPage);
+    }
+
+    function queueChange(change) {
+        config.pendingChanges.push(change);
+        clearTimeout(config.changeTimer);
+        config.changeTimer = setTimeout(applyChanges, 250);
+    }
+
+    function reloadCurrentPage() {
+        // Don't drop the reload if a page fetch is already in flight
+        if (config.isLoading) {
+            config.reloadPending = true;
+            return;
+        }
+        loadProducts();
+    }
+
+    function applyChanges() {
+        const changes = config.pendingChanges.splice(0);
+
+        // Additions and removals shift the pages, so reload the current one
+        if (changes.some(change => change.op !== 'update')) {
+            reloadCurrentPage();
+            return;
+        }
+
+        // Updates only matter for items on screen; fetch them in one call
+        const visibleIds = new Set(config.currentItems.map(item => item.id));
+        const ids = [...new Set(changes.map(change => change.id))].filter(id => visibleIds.has(id));
+        if (ids.length === 0) return;
+
+        $.ajax({
+            url: `/api/products/batch?ids=${ids.join(',')}&fields=${config.fields}`,
+            method: 'GET',
+            dataType: 'json',
+            success: function(data) {
+                const updated = new Map(data.items.map(item => [item.id, item]));
+                renderProducts(config.currentItems.map(item => updated.get(item.id) || item));
+            },
+            error: function(xhr, status, error) {
+                console.error("Error refreshing products:", status, error);
+            }
+        });
+    }
+
     function setupPagination(totalItems) {
         config.totalItems = totalItems;
         const totalPages = Math.ceil(totalItems / config.itemsPerPage);